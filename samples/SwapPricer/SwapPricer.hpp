@@ -32,17 +32,15 @@ T priceSwap(const T* discRates, bool isFixedPay, int n, const double* mat, const
 {
     using std::pow;
 
-    T Bfix = 0.0;
+    // both legs share the same discount factors, so record a single statement
+    // per period for the net cashflow of the two legs
+    T v = 0.0;
     for (int t = 0; t < n; ++t) {
-        Bfix += faceValue * fixedRate / pow(1.0 + discRates[t], mat[t]);
+        double netRate = isFixedPay ? floatRates[t] - fixedRate : fixedRate - floatRates[t];
+        v += faceValue * netRate / pow(1.0 + discRates[t], mat[t]);
     }
-    Bfix += faceValue / pow(1.0 + discRates[n - 1], mat[n - 1]);
 
-    T Bflt = 0.0;
-    for (int t = 0; t < n; ++t) {
-        Bflt += faceValue * floatRates[t] / pow(1.0 + discRates[t], mat[t]);
-    }
-    Bflt += faceValue / pow(1.0 + discRates[n - 1], mat[n - 1]);
-
-    return isFixedPay ? Bflt - Bfix : Bfix - Bflt;
+    // the notional exchanged at maturity is the same on both legs and cancels
+    // in the swap value, so it is not recorded at all
+    return v;
 }
@@ -118,6 +118,15 @@ void Tape<T>::clearAll()
     currentRec_ = &nestedRecordings_.top();
 }
 
+template <class T>
+void Tape<T>::reserve(size_type numOperations, size_type numStatements)
+{
+    multiplier_.reserve(numOperations);
+    slot_.reserve(numOperations);
+    // statement 0 is the marker added at construction
+    statement_.reserve(numStatements + 1);
+}
+
 template <class T>
 typename Tape<T>::size_type Tape<T>::getNumVariables() const
 {
@@ -406,7 +415,7 @@ void Tape<T>::initDerivatives()
 template <class T>
 T& Tape<T>::derivative(slot_type s)
 {
-    if (s >= currentRec_->maxDerivative_)
+    if (XAD_UNLIKELY(s >= currentRec_->maxDerivative_))
         throw OutOfRange("given derivative slot is out of range - did you register the outputs?");
 
     initDerivatives();
@@ -645,7 +654,7 @@ void Tape<T>::insertCallback(CheckpointCallback<Tape<T> >* cb)
 template <class T>
 void Tape<T>::incrementAdjoint(slot_type slot, const T& x)
 {
-    if (slot >= derivatives_.size())
+    if (XAD_UNLIKELY(slot >= derivatives_.size()))
         throw OutOfRange("adjoint to be incremented is out of range");
 
     derivatives_[slot] += x;
@@ -746,7 +755,7 @@ void Tape<T>::clearDerivativesAfter(position_type pos)
 template <class T>
 T Tape<T>::getAndResetOutputAdjoint(slot_type slot)
 {
-    if (slot >= slot_type(derivatives_.size()))
+    if (XAD_UNLIKELY(slot >= slot_type(derivatives_.size())))
         throw OutOfRange("Requested output slot does not exist");
 
     T ret = derivatives_[slot];
@@ -283,11 +283,7 @@ class ChunkContainer
     {
         auto n = static_cast<size_type>(std::distance(first, last));
         assert(n <= chunk_size);
-#if defined(_MSC_VER)
-        if (idx_ + n <= chunk_size)
-#else
-        if (__builtin_expect(idx_ + n <= chunk_size, 1))
-#endif
+        if (XAD_LIKELY(idx_ + n <= chunk_size))
         {
             auto dst = reinterpret_cast<value_type*>(chunkList_[chunk_]) + idx_;
             for (size_type i = 0; i < n; ++i) ::new (dst++) value_type(*first++);
@@ -435,7 +435,7 @@ struct FReal : public ADTypeBase<Scalar, FReal<Scalar>>
     {
     }
 
-    constexpr XAD_INLINE FReal(const FReal& o) : base_type(o), der_(o.der_) {}
+    constexpr XAD_INLINE FReal(const FReal& o) = default;
     constexpr XAD_INLINE FReal(FReal&& o) noexcept = default;
     XAD_INLINE FReal& operator=(const FReal& o) = default;
     XAD_INLINE FReal& operator=(FReal&& o) noexcept = default;
@@ -45,6 +45,14 @@ void ignore_unused_variable(const T&)
 #define XAD_FORCE_INLINE __attribute__((always_inline)) inline
 #endif
 
+#if defined(_MSC_VER)
+#define XAD_LIKELY(x) (x)
+#define XAD_UNLIKELY(x) (x)
+#else
+#define XAD_LIKELY(x) __builtin_expect(!!(x), 1)
+#define XAD_UNLIKELY(x) __builtin_expect(!!(x), 0)
+#endif
+
 #ifdef XAD_USE_STRONG_INLINE
 #define XAD_INLINE XAD_FORCE_INLINE
 #else
@@ -227,6 +227,7 @@ class Tape
     void pushAll(slot_type lhs, Real* multipliers, slot_type* slots, unsigned n);
 
     // capacity
+    void reserve(size_type numOperations, size_type numStatements);
     size_type getNumVariables() const;
     size_type getNumOperations() const;
     size_type getNumStatements() const;
@@ -191,7 +191,9 @@ struct fabs_op : abs_op<Scalar>
         };                                                                                         \
     };
 
-XAD_MAKE_UNARY_BINFUNCTOR(pow, Scalar(b) * Scalar(pow(a, b - T2(1))), log(b) * v)
+// a zero exponent is handled separately, as b - 1 would wrap for unsigned exponents
+XAD_MAKE_UNARY_BINFUNCTOR(pow, b == T2(0) ? Scalar(0) : Scalar(b) * Scalar(pow(a, b - T2(1))),
+                          log(b) * v)
 XAD_MAKE_UNARY_BINFUNCTOR(fmod, Scalar(1), -floor(Scalar(b) / a))
 XAD_MAKE_UNARY_BINFUNCTOR(atan2, Scalar(b) / (a * a + Scalar(b * b)),
                           -Scalar(b) / (a * a + Scalar(b * b)))
@@ -68,6 +68,21 @@ TEST(ChunkContainer, iterator_over_end)
     }
 }
 
+TEST(ChunkContainer, reserve_past_chunk)
+{
+    ChunkContainer<int, 4> chk;
+    for (int i = 0; i < 3; ++i) chk.push_back(i);
+    EXPECT_EQ(1, chk.chunk_end() - chk.chunk_begin());
+
+    chk.reserve(10);
+    EXPECT_EQ(3, chk.chunk_end() - chk.chunk_begin());
+    EXPECT_EQ(3U, chk.size());
+
+    for (int i = 3; i < 10; ++i) chk.push_back(i);
+    EXPECT_EQ(3, chk.chunk_end() - chk.chunk_begin());
+    for (int i = 0; i < 10; ++i) EXPECT_EQ(i, chk[std::size_t(i)]);
+}
+
 TEST(ChunkContainer, uninitialized_extend)
 {
     ChunkContainer<int> chk;
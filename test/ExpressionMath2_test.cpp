@@ -136,6 +136,77 @@ TEST(ExpressionsMath, pown1Expr)
                  2.3 * 2.3 * 2 * 1 * std::pow(2.3 * 0.3, 0), pown1Expr);
 }
 
+LOCAL_TEST_FUNCTOR1(pown5AD, pow(x, 5))
+TEST(ExpressionsMath, pown5AD)
+{
+    mathTest_all(0.3, std::pow(0.3, 5), 5. * std::pow(0.3, 4), 20. * std::pow(0.3, 3), pown5AD);
+}
+
+LOCAL_TEST_FUNCTOR1(pownNegAD, pow(x, -3))
+TEST(ExpressionsMath, pownNegAD)
+{
+    mathTest_all(0.3, std::pow(0.3, -3), -3. * std::pow(0.3, -4), 12. * std::pow(0.3, -5),
+                 pownNegAD);
+}
+
+LOCAL_TEST_FUNCTOR1(pownUnsignedExpr, pow(2.3 * x, 3u))
+TEST(ExpressionsMath, pownUnsignedExpr)
+{
+    mathTest_all(0.3, std::pow(2.3 * 0.3, 3), 2.3 * 3. * std::pow(2.3 * 0.3, 2),
+                 2.3 * 2.3 * 6. * (2.3 * 0.3), pownUnsignedExpr);
+}
+
+LOCAL_TEST_FUNCTOR1(pownZeroUnsignedExpr, pow(2.3 * x, 0u))
+TEST(ExpressionsMath, pownZeroUnsignedExpr)
+{
+    mathTest_all(2.0, 1.0, 0.0, 0.0, pownZeroUnsignedExpr);
+}
+
+TEST(ExpressionsMath, pownMatchesStdPow)
+{
+    const double xs[] = {0.1, 0.7, 1.3, 2.9, 7.5};
+    for (double x : xs)
+    {
+        for (int n = -16; n <= 16; ++n)
+        {
+            EXPECT_EQ(std::pow(x, n), value(pow(xad::AD(x), n))) << "x=" << x << ", n=" << n;
+            EXPECT_EQ(std::pow(x, n), value(pow(xad::FAD(x), n))) << "x=" << x << ", n=" << n;
+        }
+    }
+}
+
+LOCAL_TEST_FUNCTOR1(pownLargeAD, pow(x, 1000))
+TEST(ExpressionsMath, pownLargeAD)
+{
+    mathTest_all(1.0001, std::pow(1.0001, 1000), 1000. * std::pow(1.0001, 999),
+                 1000. * 999. * std::pow(1.0001, 998), pownLargeAD);
+}
+
+TEST(ExpressionsMath, pownLargeNegativeAD)
+{
+    xad::Tape<double> s;
+    xad::AD x = 2.0;
+    s.registerInput(x);
+    s.newRecording();
+    xad::AD y = pow(x, -1074);
+    s.registerOutput(y);
+    derivative(y) = 1.0;
+    s.computeAdjoints();
+
+    EXPECT_DOUBLE_EQ(std::pow(2.0, -1074), value(y));
+    EXPECT_GT(value(y), 0.0);
+    EXPECT_DOUBLE_EQ(-1074. * std::pow(2.0, -1075), derivative(x));
+}
+
+TEST(ExpressionsMath, pownFloatAD)
+{
+    xad::FReal<float> x(1.0001f, 1.0f);
+    xad::FReal<float> y = pow(x, 5000);
+
+    EXPECT_FLOAT_EQ(float(std::pow(1.0001f, 5000)), value(y));
+    EXPECT_FLOAT_EQ(float(5000. * std::pow(1.0001f, 4999)), derivative(y));
+}
+
 LOCAL_TEST_FUNCTOR1(sqrtAD, sqrt(x))
 TEST(ExpressionsMath, sqrtAD)
 {
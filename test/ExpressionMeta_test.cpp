@@ -28,6 +28,7 @@
 #include <XAD/XAD.hpp>
 
 #include <type_traits>
+#include <utility>
 
 using namespace ::testing;
 
@@ -286,4 +287,31 @@ TEST(ExpressionMeta, LongExpression)
     static_assert(xad::ExprTraits<complex_expr>::numVariables == 3, "should be 3 variables");
     static_assert(xad::ExprTraits<complex_expr>::direction == xad::Direction::DIR_REVERSE,
                   "should be reverse");
-}
\ No newline at end of file
+}
+
+TEST(ExpressionMeta, hypotWithScalarIsUnaryExpr)
+{
+    using hypot_ad_scalar = decltype(xad::hypot(std::declval<xad::AD>(), 0.5));
+    using hypot_scalar_ad = decltype(xad::hypot(0.5, std::declval<xad::AD>()));
+
+    static_assert(
+        (std::is_same<hypot_ad_scalar,
+                      xad::UnaryExpr<double, xad::scalar_hypot2_op<double, double>,
+                                     xad::ADVar<double>>>::value),
+        "hypot with a passive second argument should record a single partial");
+    static_assert(
+        (std::is_same<hypot_scalar_ad,
+                      xad::UnaryExpr<double, xad::scalar_hypot1_op<double, double>,
+                                     xad::ADVar<double>>>::value),
+        "hypot with a passive first argument should record a single partial");
+}
+
+TEST(ExpressionMeta, forwardTypesAreTriviallyCopyable)
+{
+    static_assert(std::is_trivially_copyable<xad::FReal<double>>::value,
+                  "FReal<double> should be trivially copyable");
+    static_assert(std::is_trivially_copyable<xad::FReal<float>>::value,
+                  "FReal<float> should be trivially copyable");
+    static_assert(std::is_trivially_copyable<xad::FReal<xad::FReal<double>>>::value,
+                  "nested FReal should be trivially copyable");
+}
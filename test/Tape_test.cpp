@@ -316,6 +316,39 @@ TEST(Tape, canPushCombined)
     EXPECT_DOUBLE_EQ(M_PI, s.getDerivative(x2s));
 }
 
+TEST(Tape, canReserveDuringRecording)
+{
+    xad::Tape<double> s;
+
+    // putting z = 2*x1 + 3*x2;
+    auto x1s = s.registerVariable();
+    auto x2s = s.registerVariable();
+    s.newRecording();
+    auto zs = s.registerVariable();
+    s.pushRhs(2.0, x1s);
+    s.pushRhs(3.0, x2s);
+    s.pushLhs(zs);
+
+    // sizes are totals from the start of the tape, reaching into a second chunk
+    const std::size_t n = xad::TapeContainerTraits<double>::type::chunk_size + 10;
+    s.reserve(2U + n, 2U);
+    EXPECT_EQ(2U, s.getNumOperations());
+    EXPECT_EQ(1U, s.getNumStatements());
+
+    // putting y = z + (n-1)*x1, with the operations crossing the chunk boundary
+    auto ys = s.registerVariable();
+    s.pushRhs(1.0, zs);
+    for (std::size_t i = 1; i < n; ++i) s.pushRhs(1.0, x1s);
+    s.pushLhs(ys);
+    EXPECT_EQ(2U + n, s.getNumOperations());
+    EXPECT_EQ(2U, s.getNumStatements());
+
+    s.setDerivative(ys, 1.0);
+    s.computeAdjoints();
+    EXPECT_DOUBLE_EQ(2.0 + double(n - 1), s.getDerivative(x1s));
+    EXPECT_DOUBLE_EQ(3.0, s.getDerivative(x2s));
+}
+
 #ifdef XAD_TAPE_REUSE_SLOTS
 TEST(Tape, restartingRecordingResetsMemory)
 {